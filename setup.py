@@ -0,0 +1,21 @@
+"""Build hook for the optional compiled kernels; metadata lives in pyproject.toml."""
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # pragma: no cover - fall back to the Numba/NumPy kernels
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "backtest._kernels",
+                ["src/backtest/_kernels.pyx"],
+                extra_compile_args=["-O3"],
+                # A missing compiler must not break installation.
+                optional=True,
+            )
+        ]
+    )
+
+setup(ext_modules=ext_modules)
@@ -1,10 +1,42 @@
 """Backtesting utilities."""
-from .engine import BacktestEngine, BacktestResult
-from .report import create_report_figure, render_report
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .engine import BacktestEngine, BacktestResult, Trades
+    from .report import ReportRenderer, create_report_figure, render_report
+
+# Submodules pull in numba and matplotlib, so they are imported on first access
+# only; this keeps ``python -m backtest.cli --help`` fast.
+_EXPORTS = {
+    "BacktestEngine": "engine",
+    "BacktestResult": "engine",
+    "ReportRenderer": "report",
+    "Trades": "engine",
+    "create_report_figure": "report",
+    "render_report": "report",
+}
 
 __all__ = [
     "BacktestEngine",
     "BacktestResult",
+    "ReportRenderer",
+    "Trades",
     "create_report_figure",
     "render_report",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,40 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Ahead-of-time compiled kernels; see ``engine._run_kernel_loop`` for the reference."""
+from libc.math cimport isnan, sqrt
+
+
+def run_kernel(
+    const float[:] close,
+    const float[:] signals,
+    double capital,
+    float[::1] equity,
+    float[::1] strategy_returns,
+):
+    cdef Py_ssize_t n = close.shape[0]
+    cdef Py_ssize_t i
+    cdef double eq = capital
+    cdef double peak = capital
+    cdef double max_dd = 0.0
+    cdef double mean = 0.0
+    cdef double m2 = 0.0
+    cdef double r, sr, dd, delta
+
+    equity[0] = <float>capital
+    strategy_returns[0] = 0.0
+    for i in range(1, n):
+        r = <double>close[i] / <double>close[i - 1] - 1.0
+        if isnan(r):
+            r = 0.0
+        sr = <double>signals[i - 1] * r
+        strategy_returns[i] = <float>sr
+        eq *= 1.0 + sr
+        equity[i] = <float>eq
+        if eq > peak:
+            peak = eq
+        dd = eq / peak - 1.0
+        if dd < max_dd:
+            max_dd = dd
+        delta = sr - mean
+        mean += delta / (i + 1)
+        m2 += delta * (sr - mean)
+    return eq, max_dd, sqrt(m2 / n), mean
@@ -2,15 +2,13 @@
 from __future__ import annotations
 
 import argparse
+import webbrowser
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
-from backtest.engine import BacktestEngine
-from backtest.report import render_report
-from data.historical import HistoricalPriceLoader
-from strategies.moving_average import MovingAverageCrossover
-
 
+@lru_cache(maxsize=None)
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run a moving average crossover backtest on daily price data.",
@@ -51,7 +49,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--show",
         action="store_true",
-        help="Display the generated report interactively after saving",
+        help="Open the saved report in the system image viewer",
     )
     return parser
 
@@ -65,6 +63,13 @@ def main(argv: Sequence[str] | None = None) -> int:
     if args.fast >= args.slow:
         parser.error("Fast EMA window should be smaller than slow EMA window")
 
+    # Deferred so that ``--help`` and argument errors skip numba/pandas/requests.
+    import numpy as np
+
+    from backtest.engine import BacktestEngine
+    from data.historical import HistoricalPriceLoader
+    from strategies.moving_average import MovingAverageCrossover
+
     cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else None
     loader_kwargs = {"cache_dir": cache_dir} if cache_dir else {}
     loader = HistoricalPriceLoader(**loader_kwargs)
@@ -96,11 +101,14 @@ def main(argv: Sequence[str] | None = None) -> int:
             "holding_period",
             "status",
         ]
-        trade_display = result.trades[display_cols].copy()
-        trade_display["return_pct"] = trade_display["return_pct"].map(lambda x: f"{x:.2%}")
-        trade_display["holding_period"] = trade_display["holding_period"].map(lambda x: f"{int(x)}d")
+        trades = result.trades
+        trade_display = trades.to_dataframe()[display_cols]
+        trade_display["return_pct"] = np.char.mod("%.2f%%", trades.return_pct * 100)
+        trade_display["holding_period"] = np.char.mod("%dd", trades.holding_period.astype(np.int64))
         print(trade_display.to_string(index=False))
 
+    from backtest.report import render_report  # matplotlib is only needed from here on
+
     output_report = args.report or Path.cwd() / f"{args.ticker.lower()}_backtest.png"
     report_path = render_report(
         prices,
@@ -109,9 +117,11 @@ def main(argv: Sequence[str] | None = None) -> int:
         slow_window=args.slow,
         output=output_report,
         ticker=args.ticker.upper(),
-        show=args.show,
     )
     print(f"\nReport saved to: {report_path}")
+    if args.show:
+        # The report backend is headless (Agg); hand the PNG to the system viewer instead.
+        webbrowser.open(report_path.as_uri())
 
     return 0
 
@@ -2,20 +2,225 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, Sequence
 
+import numpy as np
 import pandas as pd
+from numpy.typing import ArrayLike
+
+from strategies.moving_average import _ema_step
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba wheels lag new Python releases
+    njit = None
+    prange = range
+
+
+def _run_kernel_loop(
+    close: np.ndarray,
+    signals: np.ndarray,
+    capital: float,
+    equity: np.ndarray,
+    strategy_returns: np.ndarray,
+) -> tuple[float, float, float, float]:
+    """Fused pass filling ``equity`` and ``strategy_returns`` in place.
+
+    Positions lag signals by one bar. The running equity and return statistics
+    are accumulated in float64 whatever the array dtypes; returns ``(final_equity,
+    max_drawdown, daily_volatility, mean_daily_return)`` where the volatility is
+    the population standard deviation, accumulated with Welford's method.
+    """
+    n = close.shape[0]
+    equity[0] = capital
+    strategy_returns[0] = 0.0
+
+    eq = np.float64(capital)
+    peak = eq
+    max_dd = 0.0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, n):
+        r = np.float64(close[i]) / np.float64(close[i - 1]) - 1.0
+        if np.isnan(r):
+            r = 0.0
+        sr = np.float64(signals[i - 1]) * r
+        strategy_returns[i] = sr
+        eq *= 1.0 + sr
+        equity[i] = eq
+        if eq > peak:
+            peak = eq
+        dd = eq / peak - 1.0
+        if dd < max_dd:
+            max_dd = dd
+        delta = sr - mean
+        mean += delta / (i + 1)
+        m2 += delta * (sr - mean)
+    return eq, max_dd, np.sqrt(m2 / n), mean
+
+
+def _run_kernel_numpy(
+    close: np.ndarray,
+    signals: np.ndarray,
+    capital: float,
+    equity: np.ndarray,
+    strategy_returns: np.ndarray,
+) -> tuple[float, float, float, float]:
+    """Vectorised equivalent of ``_run_kernel_loop`` for when no compiler is available."""
+    close = close.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = close[1:] / close[:-1] - 1.0
+    returns[np.isnan(returns)] = 0.0
+    daily = np.zeros(len(close), dtype=np.float64)
+    daily[1:] = signals[:-1] * returns
+    curve = np.cumprod(1.0 + daily) * capital
+    equity[:] = curve
+    strategy_returns[:] = daily
+    drawdown = curve / np.maximum.accumulate(curve) - 1.0
+    return curve[-1], min(drawdown.min(), 0.0), daily.std(), daily.mean()
+
+
+def _grid_kernel_loop(
+    close: np.ndarray, fast_alphas: np.ndarray, slow_alphas: np.ndarray, capital: float
+) -> np.ndarray:
+    """EMA crossover backtest for every (fast, slow) alpha pair, one pair per thread.
+
+    Each column runs the same recurrences as the crossover strategy and
+    ``_run_kernel_loop`` without materialising signals or equity curves. Returns a
+    ``(K, 4)`` array of ``final_equity, max_drawdown, daily_volatility,
+    mean_daily_return``.
+    """
+    n = close.shape[0]
+    k = fast_alphas.shape[0]
+    out = np.empty((k, 4), dtype=np.float64)
+    for j in prange(k):
+        a_fast = fast_alphas[j]
+        a_slow = slow_alphas[j]
+        ef = close[0]
+        es = close[0]
+        wf = 1.0
+        ws = 1.0
+        position = 0.0
+        eq = capital
+        peak = capital
+        max_dd = 0.0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(1, n):
+            x = close[i]
+            r = x / close[i - 1] - 1.0
+            if np.isnan(r):
+                r = 0.0
+            sr = position * r
+            eq *= 1.0 + sr
+            if eq > peak:
+                peak = eq
+            dd = eq / peak - 1.0
+            if dd < max_dd:
+                max_dd = dd
+            delta = sr - mean
+            mean += delta / (i + 1)
+            m2 += delta * (sr - mean)
+
+            ef, wf = _ema_step(ef, wf, x, a_fast)
+            es, ws = _ema_step(es, ws, x, a_slow)
+            position = 1.0 if ef > es else 0.0
+        out[j, 0] = eq
+        out[j, 1] = max_dd
+        out[j, 2] = np.sqrt(m2 / n)
+        out[j, 3] = mean
+    return out
+
+
+# Prefer the ahead-of-time compiled kernel (``_kernels.pyx``, built by setup.py),
+# then the Numba JIT, then plain NumPy.
+try:
+    from backtest._kernels import run_kernel as _run_kernel
+except ImportError:
+    _run_kernel = njit(cache=True)(_run_kernel_loop) if njit is not None else _run_kernel_numpy
+
+# Without numba the grid sweep still works, as a (slow) pure-Python loop.
+_grid_kernel = njit(cache=True, parallel=True)(_grid_kernel_loop) if njit is not None else _grid_kernel_loop
+
+
+def _naive_datetimes(values: pd.Series | pd.Index) -> np.ndarray:
+    """Return ``values`` as a NumPy array with any timezone dropped.
+
+    tz-aware columns would otherwise come out as object arrays of
+    ``Timestamp``; the local wall-clock time is kept.
+    """
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.tz_localize(None) if isinstance(values, pd.Index) else values.dt.tz_localize(None)
+    return values.to_numpy()
 
 
 class Strategy(Protocol):
+    """Anything with ``generate_signals``.
+
+    A strategy may also provide ``compute(prices) -> (signals, fast_ema,
+    slow_ema)``; the engine then keeps the EMAs on the result for reporting.
+    """
+
     def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
         ...
 
 
 @dataclass
+class Trades:
+    """Trade log stored as parallel arrays, one element per trade.
+
+    ``entry_idx``/``exit_idx`` are bar positions in the sorted price frame and
+    ``status`` is :attr:`CLOSED` or :attr:`OPEN` (still held on the last bar).
+    """
+
+    CLOSED = 0
+    OPEN = 1
+
+    entry_idx: np.ndarray
+    exit_idx: np.ndarray
+    entry_date: np.ndarray
+    exit_date: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    return_pct: np.ndarray
+    holding_period: np.ndarray
+    status: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.entry_idx)
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the trades as a DataFrame for display."""
+        return pd.DataFrame(
+            {
+                "entry_date": self.entry_date,
+                "entry_price": self.entry_price,
+                "exit_date": self.exit_date,
+                "exit_price": self.exit_price,
+                "return_pct": self.return_pct,
+                "holding_period": self.holding_period,
+                "status": np.where(self.status == self.OPEN, "OPEN", "CLOSED"),
+            }
+        )
+
+
+@dataclass(frozen=True)
 class BacktestResult:
+    """Outcome of a backtest run; frozen so results can be shared safely.
+
+    ``equity_curve`` and ``daily_returns`` are stored as float32 (about seven
+    significant digits), which is ample for daily bar returns. The scalar
+    metrics, including ``final_equity``, are accumulated and reported in
+    float64; prefer ``final_equity`` over ``equity_curve.iloc[-1]`` for large
+    capital amounts.
+    """
+
     equity_curve: pd.Series
-    trades: pd.DataFrame
+    trades: Trades
     total_return: float
     annualized_return: float
     max_drawdown: float
@@ -23,6 +228,9 @@ class BacktestResult:
     daily_returns: pd.Series
     volatility: float
     sharpe_ratio: float
+    final_equity: float
+    fast_ema: pd.Series | None = None
+    slow_ema: pd.Series | None = None
 
 
 @dataclass
@@ -33,120 +241,171 @@ class BacktestEngine:
         if prices.empty:
             raise ValueError("Price data is empty")
 
-        prices = prices.sort_values("date").reset_index(drop=True)
-        signals = strategy.generate_signals(prices)
+        prices = self._sorted_by_date(prices)
+        compute = getattr(strategy, "compute", None)
+        if compute is not None:
+            signals, fast_values, slow_values = compute(prices)
+        else:
+            signals = strategy.generate_signals(prices)
+            fast_values = slow_values = None
         if len(signals) != len(prices):
             raise ValueError("Signals length must match prices length")
 
-        if "date" in prices.columns:
-            signals.index = prices["date"]
-
-        returns = prices["close"].pct_change().fillna(0.0)
-        positions = signals.shift(1).fillna(0.0)  # enter at next bar open
-
-        if "date" in prices.columns:
-            index = prices["date"]
-            returns.index = index
-            positions.index = index
-        strategy_returns = positions * returns
-
-        if "date" in prices.columns:
-            strategy_returns.index = index
+        index = prices["date"] if "date" in prices.columns else prices.index
+        signals.index = index
+        fast_ema = self._indicator(fast_values, "fast_ema", index)
+        slow_ema = self._indicator(slow_values, "slow_ema", index)
+
+        close = prices["close"].to_numpy(dtype=np.float32)
+        # A NaN signal means flat, as pandas' NaN-skipping reductions treated it.
+        signal_values = np.nan_to_num(signals.to_numpy(dtype=np.float32, copy=True), copy=False)
+        equity = np.empty(len(close), dtype=np.float32)
+        strategy_returns = np.empty(len(close), dtype=np.float32)
+        final_equity, max_drawdown, daily_vol, mean_return = _run_kernel(
+            close, signal_values, float(self.initial_capital), equity, strategy_returns
+        )
 
-        equity_curve = (1 + strategy_returns).cumprod() * self.initial_capital
+        # Kept in the signal dtype: fractional positions must still open trades.
+        positions = np.zeros_like(signal_values)  # enter at next bar open
+        positions[1:] = signal_values[:-1]
+        strategy_returns = pd.Series(strategy_returns, index=index)
+        equity_curve = pd.Series(equity, index=index)
 
         trades = self._build_trades(positions, prices)
-        total_return = equity_curve.iloc[-1] / self.initial_capital - 1
-        annualized_return = self._annualized_return(strategy_returns)
-        max_drawdown = self._max_drawdown(equity_curve)
-        volatility = self._annualized_volatility(strategy_returns)
-        sharpe_ratio = self._sharpe_ratio(strategy_returns, volatility)
+        total_return = float(final_equity / self.initial_capital - 1)
+        annualized_return = float(self._annualized_return(total_return, len(equity)))
+        volatility = float(self._annualized_volatility(daily_vol))
+        sharpe_ratio = float(self._sharpe_ratio(mean_return, volatility))
 
         return BacktestResult(
             equity_curve=equity_curve,
             trades=trades,
             total_return=total_return,
             annualized_return=annualized_return,
-            max_drawdown=max_drawdown,
+            max_drawdown=float(max_drawdown),
             signals=signals,
             daily_returns=strategy_returns,
             volatility=volatility,
             sharpe_ratio=sharpe_ratio,
+            final_equity=float(final_equity),
+            fast_ema=fast_ema,
+            slow_ema=slow_ema,
         )
 
-    def _build_trades(self, positions: pd.Series, prices: pd.DataFrame) -> pd.DataFrame:
-        if positions.empty:
-            return pd.DataFrame()
-
-        trade_frame = prices.copy()
-        if "date" not in trade_frame.columns:
-            trade_frame = trade_frame.copy()
-            trade_frame["date"] = range(len(trade_frame))
-
-        trade_frame["position"] = positions.to_numpy()
-        trade_frame["position_change"] = trade_frame["position"].diff().fillna(trade_frame["position"])
-
-        entry_price_col = "open" if "open" in trade_frame.columns else "close"
-        exit_price_col = entry_price_col
-
-        entries = trade_frame.loc[trade_frame["position_change"] > 0, ["date", entry_price_col]]
-        exits = trade_frame.loc[trade_frame["position_change"] < 0, ["date", exit_price_col]]
-
-        trades = entries.rename(columns={"date": "entry_date", entry_price_col: "entry_price"}).reset_index(drop=True)
-        exit_frame = exits.rename(columns={"date": "exit_date", exit_price_col: "exit_price"}).reset_index(drop=True)
-        exit_frame["is_open"] = False
-
-        if len(exit_frame) < len(trades):
-            remaining = len(trades) - len(exit_frame)
-            last_row = trade_frame.iloc[-1]
-            last_date = last_row["date"]
-            last_price = last_row[exit_price_col]
-            open_exits = pd.DataFrame(
-                {
-                    "exit_date": [last_date] * remaining,
-                    "exit_price": [last_price] * remaining,
-                    "is_open": [True] * remaining,
-                }
-            )
-            exit_frame = pd.concat([exit_frame, open_exits], ignore_index=True)
-
-        trades = trades.join(exit_frame)
-        if trades.empty:
-            return trades
-
-        trades["return_pct"] = trades["exit_price"] / trades["entry_price"] - 1
-
-        if pd.api.types.is_datetime64_any_dtype(trades["entry_date"]):
-            trades["holding_period"] = (trades["exit_date"] - trades["entry_date"]).dt.days
-        else:
-            trades["holding_period"] = trades["exit_date"] - trades["entry_date"]
-
-        trades["status"] = trades.pop("is_open").map({True: "OPEN", False: "CLOSED"})
-        return trades.sort_values("entry_date").reset_index(drop=True)
+    def run_grid(
+        self,
+        prices: pd.DataFrame,
+        fast_windows: Sequence[int],
+        slow_windows: Sequence[int],
+    ) -> pd.DataFrame:
+        """Backtest an EMA crossover for every ``fast < slow`` window combination.
+
+        Combinations are evaluated in parallel and summarised one row each;
+        no equity curves or trades are kept.
+        """
+        if prices.empty:
+            raise ValueError("Price data is empty")
 
-    def _annualized_return(self, daily_returns: pd.Series) -> float:
-        compounded = (1 + daily_returns).prod()
-        num_days = len(daily_returns)
-        if num_days == 0:
-            return 0.0
-        return compounded ** (252 / num_days) - 1
+        prices = self._sorted_by_date(prices)
+        pairs = [(fast, slow) for fast in fast_windows for slow in slow_windows if fast < slow]
+        if not pairs:
+            raise ValueError("No window combination with fast < slow")
+        windows = np.array(pairs, dtype=np.int64)
+
+        close = prices["close"].to_numpy(dtype=np.float64)
+        stats = _grid_kernel(
+            close,
+            2.0 / (windows[:, 0] + 1),
+            2.0 / (windows[:, 1] + 1),
+            float(self.initial_capital),
+        )
 
-    def _annualized_volatility(self, daily_returns: pd.Series) -> float:
-        if daily_returns.empty:
-            return 0.0
-        daily_vol = daily_returns.std(ddof=0)
-        return float(daily_vol * (252 ** 0.5)) if daily_vol != 0 else 0.0
+        final_equity, max_drawdown, daily_vol, mean_return = stats.T
+        total_return = final_equity / self.initial_capital - 1
+        volatility = self._annualized_volatility(daily_vol)
+        return pd.DataFrame(
+            {
+                "fast_window": windows[:, 0],
+                "slow_window": windows[:, 1],
+                "total_return": total_return,
+                "annualized_return": self._annualized_return(total_return, len(close)),
+                "max_drawdown": max_drawdown,
+                "volatility": volatility,
+                "sharpe_ratio": self._sharpe_ratio(mean_return, volatility),
+            }
+        )
 
-    def _sharpe_ratio(self, daily_returns: pd.Series, volatility: float) -> float:
-        if daily_returns.empty or volatility == 0:
-            return 0.0
-        mean_return = daily_returns.mean()
-        return float(mean_return * 252 / volatility)
+    @staticmethod
+    def _sorted_by_date(prices: pd.DataFrame) -> pd.DataFrame:
+        # Loader output is already in date order; avoid an O(N log N) sort and a copy.
+        if prices["date"].is_monotonic_increasing:
+            return prices
+        return prices.sort_values("date").reset_index(drop=True)
+
+    @staticmethod
+    def _indicator(values: np.ndarray | None, name: str, index: pd.Index) -> pd.Series | None:
+        if values is None:
+            return None
+        return pd.Series(values, index=index, name=name)
+
+    def _build_trades(self, positions: np.ndarray, prices: pd.DataFrame) -> Trades:
+        # Only the date and fill-price columns are read, as NumPy views.
+        if "date" in prices.columns:
+            dates = _naive_datetimes(prices["date"])
+        else:
+            dates = np.arange(len(prices))
+        entry_price_col = "open" if "open" in prices.columns else "close"
+        fill_prices = prices[entry_price_col].to_numpy()
+
+        position_change = np.diff(positions, prepend=0)
+        entry_idx = np.flatnonzero(position_change > 0)
+        exit_idx = np.flatnonzero(position_change < 0)[: len(entry_idx)]
+
+        # Positions still held at the end are marked to the last bar.
+        num_open = len(entry_idx) - len(exit_idx)
+        exit_idx = np.concatenate([exit_idx, np.full(num_open, len(positions) - 1, dtype=exit_idx.dtype)])
+        status = np.full(len(entry_idx), Trades.CLOSED, dtype=np.int8)
+        status[len(entry_idx) - num_open :] = Trades.OPEN
+
+        entry_dates = dates[entry_idx]
+        exit_dates = dates[exit_idx]
+        entry_prices = fill_prices[entry_idx]
+        exit_prices = fill_prices[exit_idx]
+
+        holding_period = exit_dates - entry_dates
+        if np.issubdtype(dates.dtype, np.datetime64):
+            holding_period = holding_period // np.timedelta64(1, "D")
+
+        return Trades(
+            entry_idx=entry_idx,
+            exit_idx=exit_idx,
+            entry_date=entry_dates,
+            exit_date=exit_dates,
+            entry_price=entry_prices,
+            exit_price=exit_prices,
+            return_pct=exit_prices / entry_prices - 1,
+            holding_period=holding_period,
+            status=status,
+        )
 
-    def _max_drawdown(self, equity_curve: pd.Series) -> float:
-        cumulative_max = equity_curve.cummax()
-        drawdowns = equity_curve / cumulative_max - 1
-        return drawdowns.min()
+    # The helpers below take scalars from ``run`` or per-combination arrays from
+    # ``run_grid``; the underlying reductions already happen in the kernels.
+    def _annualized_return(self, total_return: ArrayLike, num_days: int) -> ArrayLike:
+        if num_days == 0:
+            return np.zeros_like(total_return)
+        return (1 + total_return) ** (252 / num_days) - 1
+
+    def _annualized_volatility(self, daily_vol: ArrayLike) -> ArrayLike:
+        return daily_vol * (252 ** 0.5)
+
+    def _sharpe_ratio(self, mean_return: ArrayLike, volatility: ArrayLike) -> ArrayLike:
+        mean_return = np.asarray(mean_return, dtype=np.float64)
+        return np.divide(
+            mean_return * 252,
+            volatility,
+            out=np.zeros_like(mean_return),
+            where=np.asarray(volatility) != 0,
+        )
 
 
-__all__ = ["BacktestEngine", "BacktestResult", "Strategy"]
+__all__ = ["BacktestEngine", "BacktestResult", "Strategy", "Trades"]
@@ -9,11 +9,19 @@ import matplotlib
 matplotlib.use("Agg", force=True)
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib import dates as mdates
 from matplotlib import gridspec
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.table import Table
+from matplotlib.text import Text
 
-from backtest.engine import BacktestResult
+from backtest.engine import BacktestResult, Trades, _naive_datetimes
+from strategies.moving_average import MovingAverageCrossover
 
 
 def _format_percent(value: float) -> str:
@@ -27,21 +35,20 @@ def _build_summary_frame(result: BacktestResult) -> pd.DataFrame:
         ("Volatility", _format_percent(result.volatility)),
         ("Sharpe ratio", f"{result.sharpe_ratio:.2f}"),
         ("Max drawdown", _format_percent(result.max_drawdown)),
-        ("Final equity", f"{result.equity_curve.iloc[-1]:,.2f}"),
+        ("Final equity", f"{result.final_equity:,.2f}"),
         ("Bars", f"{len(result.equity_curve)}"),
     ]
 
     trades = result.trades
-    if not trades.empty and "return_pct" in trades.columns:
-        win_rate = (trades.loc[trades["status"] == "CLOSED", "return_pct"] > 0).mean()
-        best_trade = trades["return_pct"].max()
-        worst_trade = trades["return_pct"].min()
+    if not trades.empty:
+        closed_returns = trades.return_pct[trades.status == Trades.CLOSED]
+        win_rate = (closed_returns > 0).mean() if len(closed_returns) else 0.0
         rows.extend(
             [
-                ("Win rate", _format_percent(win_rate if pd.notna(win_rate) else 0.0)),
-                ("Best trade", _format_percent(best_trade)),
-                ("Worst trade", _format_percent(worst_trade)),
-                ("Completed trades", str(int((trades["status"] == "CLOSED").sum()))),
+                ("Win rate", _format_percent(win_rate)),
+                ("Best trade", _format_percent(trades.return_pct.max())),
+                ("Worst trade", _format_percent(trades.return_pct.min())),
+                ("Completed trades", str(len(closed_returns))),
             ]
         )
 
@@ -49,33 +56,266 @@ def _build_summary_frame(result: BacktestResult) -> pd.DataFrame:
     return summary.set_index("Metric")
 
 
-def _format_trades(trades: pd.DataFrame, limit: int = 8) -> pd.DataFrame:
+def _format_trades(trades: Trades, limit: int = 8) -> pd.DataFrame:
     if trades.empty:
         return pd.DataFrame({"message": ["No completed trades"]})
-    truncated = trades.tail(limit).copy()
-    display_cols: Iterable[str]
-    display_cols = [
-        "entry_date",
-        "exit_date",
-        "entry_price",
-        "exit_price",
-        "return_pct",
-        "holding_period",
-        "status",
-    ]
-    truncated = truncated[display_cols]
+    tail = slice(-limit, None)
+
+    entry_dates = trades.entry_date[tail]
+    exit_dates = trades.exit_date[tail]
+    if np.issubdtype(entry_dates.dtype, np.datetime64):
+        entry_dates = np.datetime_as_string(entry_dates, unit="D")
+        exit_dates = np.datetime_as_string(exit_dates, unit="D")
+
+    truncated = pd.DataFrame(
+        {
+            "entry_date": entry_dates,
+            "exit_date": exit_dates,
+            "entry_price": np.char.mod("%.2f", trades.entry_price[tail]),
+            "exit_price": np.char.mod("%.2f", trades.exit_price[tail]),
+            "return_pct": np.char.mod("%.2f%%", trades.return_pct[tail] * 100),
+            "holding_period": np.char.mod("%dd", trades.holding_period[tail].astype(np.int64)),
+            "status": np.where(trades.status[tail] == Trades.OPEN, "OPEN", "CLOSED"),
+        }
+    )
+    return truncated
 
-    if pd.api.types.is_datetime64_any_dtype(truncated["entry_date"]):
-        truncated["entry_date"] = truncated["entry_date"].dt.strftime("%Y-%m-%d")
-    if pd.api.types.is_datetime64_any_dtype(truncated["exit_date"]):
-        truncated["exit_date"] = truncated["exit_date"].dt.strftime("%Y-%m-%d")
 
-    for column in ("entry_price", "exit_price"):
-        truncated[column] = truncated[column].map(lambda x: f"{x:,.2f}")
+class ReportRenderer:
+    """Draw backtest reports into one reusable figure.
+
+    The figure, axes and artists are created on the first :meth:`draw`; later
+    calls only swap line data, markers and table text. This makes rendering
+    many reports (e.g. a parameter sweep) much cheaper than building a fresh
+    figure each time. When a table has to be rebuilt, the layout is reset and
+    recomputed so the output matches a freshly built figure.
+    """
+
+    def __init__(self) -> None:
+        self.figure: Figure | None = None
+        self._ax_price: Axes | None = None
+        self._ax_equity: Axes | None = None
+        self._ax_table: Axes | None = None
+        self._lines: dict[str, Line2D] = {}
+        self._markers: dict[str, PathCollection] = {}
+        self._message: Text | None = None
+        self._summary_table: Table | None = None
+        self._trade_table: Table | None = None
+        self._subplotpars: dict[str, float] = {}
+        self._stale_layout = False
+
+    def __enter__(self) -> ReportRenderer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.figure is not None:
+            plt.close(self.figure)
+        self.__init__()
+
+    def draw(
+        self,
+        prices: pd.DataFrame,
+        result: BacktestResult,
+        *,
+        fast_window: int,
+        slow_window: int,
+        ticker: str | None = None,
+    ) -> Figure:
+        """Draw the report for ``result`` and return the (reused) figure."""
+        if "date" not in prices.columns:
+            raise ValueError("prices must contain a 'date' column for plotting")
+
+        indexed_prices = prices.set_index("date")
+        close = indexed_prices["close"]
+        fast = result.fast_ema
+        slow = result.slow_ema
+        if fast is None or slow is None:
+            # The strategy did not hand its EMAs on; rebuild them with the
+            # crossover's Numba kernel rather than two pandas ewm passes.
+            crossover = MovingAverageCrossover(fast_window, slow_window)
+            _, fast_values, slow_values = crossover.compute(indexed_prices)
+            fast = pd.Series(fast_values, index=close.index)
+            slow = pd.Series(slow_values, index=close.index)
+
+        if self.figure is None:
+            self._build_layout()
+        fig = self.figure
+        fig.suptitle(f"Backtest report{f' - {ticker}' if ticker else ''}", fontsize=14)
+
+        dates = _naive_datetimes(close.index)
+        self._ax_price.xaxis.update_units(dates)
+        self._lines["close"].set_data(dates, close.to_numpy())
+        self._lines["fast"].set_data(dates, fast.to_numpy())
+        self._lines["fast"].set_label(f"EMA {fast_window}")
+        self._lines["slow"].set_data(dates, slow.to_numpy())
+        self._lines["slow"].set_label(f"EMA {slow_window}")
+        self._lines["equity"].set_data(
+            _naive_datetimes(result.equity_curve.index), result.equity_curve.to_numpy()
+        )
 
-    truncated["return_pct"] = truncated["return_pct"].map(_format_percent)
-    truncated["holding_period"] = truncated["holding_period"].map(lambda x: f"{int(x)}d")
-    return truncated
+        trades = result.trades
+        closed = trades.status == Trades.CLOSED
+        self._set_markers("entry", trades.entry_date, trades.entry_price)
+        self._set_markers("exit", trades.exit_date[closed], trades.exit_price[closed])
+        handles = [self._lines["close"], self._lines["fast"], self._lines["slow"]]
+        handles += [marker for marker in self._markers.values() if len(marker.get_offsets())]
+        self._ax_price.legend(handles=handles, loc="upper left")
+
+        for ax in (self._ax_price, self._ax_equity):
+            ax.relim()
+            ax.autoscale_view()
+
+        self._draw_tables(result)
+
+        if self._stale_layout:
+            fig.tight_layout(rect=[0, 0, 1, 0.97])
+            self._stale_layout = False
+        return fig
+
+    def save(self, output: Path, *, dpi: int = 150) -> Path:
+        """Save the current figure to ``output`` and return the resolved path."""
+        if self.figure is None:
+            raise RuntimeError("Nothing has been drawn yet")
+        output = _prepare_output(output)
+        self.figure.savefig(output, dpi=dpi)
+        return output
+
+    def render_many(
+        self,
+        prices: pd.DataFrame,
+        runs: Iterable[tuple[BacktestResult, int, int]],
+        outputs: Iterable[Path],
+        *,
+        ticker: str | None = None,
+        dpi: int = 150,
+    ) -> list[Path]:
+        """Save one report per ``(result, fast_window, slow_window)`` in ``runs``."""
+        paths = []
+        for (result, fast_window, slow_window), output in zip(runs, outputs):
+            self.draw(prices, result, fast_window=fast_window, slow_window=slow_window, ticker=ticker)
+            paths.append(self.save(output, dpi=dpi))
+        return paths
+
+    def _build_layout(self) -> None:
+        fig = plt.figure(figsize=(12, 10))
+        gs = gridspec.GridSpec(3, 1, height_ratios=[3, 2, 1.6], figure=fig)
+
+        ax_price = fig.add_subplot(gs[0])
+        (self._lines["close"],) = ax_price.plot([], [], label="Close", color="#1f77b4")
+        (self._lines["fast"],) = ax_price.plot([], [], color="#ff7f0e")
+        (self._lines["slow"],) = ax_price.plot([], [], color="#2ca02c")
+        self._markers["entry"] = ax_price.scatter(
+            [], [], marker="^", color="#2ca02c", label="Entry", zorder=5
+        )
+        self._markers["exit"] = ax_price.scatter(
+            [], [], marker="v", color="#d62728", label="Exit", zorder=5
+        )
+        ax_price.set_ylabel("Price")
+        ax_price.grid(True, alpha=0.3)
+
+        ax_equity = fig.add_subplot(gs[1], sharex=ax_price)
+        (self._lines["equity"],) = ax_equity.plot([], [], color="#9467bd")
+        ax_equity.set_ylabel("Equity")
+        ax_equity.grid(True, alpha=0.3)
+
+        ax_table = fig.add_subplot(gs[2])
+        ax_table.axis("off")
+        self._message = ax_table.text(0.02, 0.25, "", fontsize=10)
+
+        self.figure = fig
+        self._subplotpars = dict(vars(fig.subplotpars))
+        self._ax_price = ax_price
+        self._ax_equity = ax_equity
+        self._ax_table = ax_table
+
+    def _reset_layout(self) -> None:
+        """Restore the pre-``tight_layout`` axes positions before rebuilding.
+
+        Table row heights are fixed from the axes size at construction, so a
+        rebuilt table has to be created against the same layout as on a fresh
+        figure, and ``tight_layout`` rerun afterwards.
+        """
+        if not self._stale_layout:
+            self.figure.subplots_adjust(**self._subplotpars)
+            self._stale_layout = True
+
+    def _set_markers(self, name: str, dates: np.ndarray, values: np.ndarray) -> None:
+        offsets = np.column_stack([mdates.date2num(dates), values]) if len(dates) else np.empty((0, 2))
+        self._markers[name].set_offsets(offsets)
+
+    def _draw_tables(self, result: BacktestResult) -> None:
+        summary = _build_summary_frame(result)
+        self._summary_table = self._fill_table(
+            self._summary_table,
+            summary.values,
+            col_labels=list(summary.columns),
+            row_labels=list(summary.index),
+            fontsize=10,
+            loc="upper left",
+            colWidths=[0.35],
+        )
+
+        trades = _format_trades(result.trades)
+        if "message" in trades.columns:
+            if self._trade_table is not None:
+                self._reset_layout()
+                self._trade_table.remove()
+                self._trade_table = None
+            self._message.set_text(trades.loc[0, "message"])
+            self._message.set_visible(True)
+        else:
+            self._message.set_visible(False)
+            self._trade_table = self._fill_table(
+                self._trade_table,
+                trades.values,
+                col_labels=list(trades.columns),
+                fontsize=9,
+                loc="lower left",
+                cellLoc="center",
+            )
+
+    def _fill_table(
+        self,
+        table: Table | None,
+        cell_text: np.ndarray,
+        *,
+        col_labels: list[str],
+        row_labels: list[str] | None = None,
+        fontsize: int,
+        **kwargs: object,
+    ) -> Table:
+        """Rewrite ``table`` in place when its shape fits, otherwise rebuild it."""
+        num_rows, num_cols = cell_text.shape
+        num_cells = (num_rows + 1) * num_cols + (num_rows if row_labels else 0)
+        if table is not None and len(table.get_celld()) == num_cells:
+            for (row, col), cell in table.get_celld().items():
+                if row == 0:
+                    text = col_labels[col]
+                elif col == -1:
+                    text = row_labels[row - 1]
+                else:
+                    text = cell_text[row - 1][col]
+                cell.get_text().set_text(text)
+            return table
+
+        self._reset_layout()
+        if table is not None:
+            table.remove()
+        table = self._ax_table.table(
+            cellText=cell_text, rowLabels=row_labels, colLabels=col_labels, **kwargs
+        )
+        table.auto_set_font_size(False)
+        table.set_fontsize(fontsize)
+        return table
+
+
+def _prepare_output(output: Path) -> Path:
+    output = output.expanduser().resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    return output
 
 
 def create_report_figure(
@@ -87,78 +327,13 @@ def create_report_figure(
     ticker: str | None = None,
 ) -> Figure:
     """Create a matplotlib figure summarising the strategy performance."""
-    if "date" not in prices.columns:
-        raise ValueError("prices must contain a 'date' column for plotting")
-
-    indexed_prices = prices.set_index("date")
-    close = indexed_prices["close"]
-    fast = close.ewm(span=fast_window, adjust=False).mean()
-    slow = close.ewm(span=slow_window, adjust=False).mean()
-
-    fig = plt.figure(figsize=(12, 10))
-    fig.suptitle(f"Backtest report{f' - {ticker}' if ticker else ''}", fontsize=14)
-    gs = gridspec.GridSpec(3, 1, height_ratios=[3, 2, 1.6], figure=fig)
-
-    ax_price = fig.add_subplot(gs[0])
-    ax_price.plot(close.index, close.values, label="Close", color="#1f77b4")
-    ax_price.plot(fast.index, fast.values, label=f"EMA {fast_window}", color="#ff7f0e")
-    ax_price.plot(slow.index, slow.values, label=f"EMA {slow_window}", color="#2ca02c")
-    ax_price.set_ylabel("Price")
-    ax_price.legend(loc="upper left")
-    ax_price.grid(True, alpha=0.3)
-
-    if not result.trades.empty:
-        entry_dates = result.trades["entry_date"]
-        entry_prices = result.trades["entry_price"]
-        ax_price.scatter(entry_dates, entry_prices, marker="^", color="#2ca02c", label="Entry", zorder=5)
-
-        closed_trades = result.trades[result.trades["status"] == "CLOSED"]
-        if not closed_trades.empty:
-            ax_price.scatter(
-                closed_trades["exit_date"],
-                closed_trades["exit_price"],
-                marker="v",
-                color="#d62728",
-                label="Exit",
-                zorder=5,
-            )
-        ax_price.legend(loc="upper left")
-
-    ax_equity = fig.add_subplot(gs[1], sharex=ax_price)
-    ax_equity.plot(result.equity_curve.index, result.equity_curve.values, color="#9467bd")
-    ax_equity.set_ylabel("Equity")
-    ax_equity.grid(True, alpha=0.3)
-
-    summary = _build_summary_frame(result)
-    trades = _format_trades(result.trades)
-
-    ax_table = fig.add_subplot(gs[2])
-    ax_table.axis("off")
-
-    summary_table = ax_table.table(
-        cellText=summary.values,
-        rowLabels=summary.index,
-        colLabels=summary.columns,
-        loc="upper left",
-        colWidths=[0.35],
+    return ReportRenderer().draw(
+        prices,
+        result,
+        fast_window=fast_window,
+        slow_window=slow_window,
+        ticker=ticker,
     )
-    summary_table.auto_set_font_size(False)
-    summary_table.set_fontsize(10)
-
-    if "message" in trades.columns:
-        ax_table.text(0.02, 0.25, trades.loc[0, "message"], fontsize=10)
-    else:
-        trade_table = ax_table.table(
-            cellText=trades.values,
-            colLabels=trades.columns,
-            loc="lower left",
-            cellLoc="center",
-        )
-        trade_table.auto_set_font_size(False)
-        trade_table.set_fontsize(9)
-
-    fig.tight_layout(rect=[0, 0, 1, 0.97])
-    return fig
 
 
 def render_report(
@@ -170,27 +345,32 @@ def render_report(
     output: Path,
     ticker: str | None = None,
     show: bool = False,
+    fig: Figure | None = None,
+    dpi: int | None = 150,
 ) -> Path:
-    """Save a visual report to ``output`` and optionally display it."""
-    output = output.expanduser().resolve()
-    output.parent.mkdir(parents=True, exist_ok=True)
-
-    fig = create_report_figure(
-        prices,
-        result,
-        fast_window=fast_window,
-        slow_window=slow_window,
-        ticker=ticker,
-    )
-    fig.savefig(output, dpi=150)
-
-    if show:
-        plt.show()
-        plt.close(fig)
-    else:
+    """Save a visual report to ``output`` and return the resolved path.
+
+    Pass ``fig`` (from :func:`create_report_figure`) to save an already drawn
+    report; the caller keeps ownership of it and it is left open. ``dpi=None``
+    defers to ``rcParams["savefig.dpi"]``. ``show`` is accepted for backwards
+    compatibility and ignored: rendering is headless (Agg), so open the saved
+    file instead.
+    """
+    output = _prepare_output(output)
+
+    owned = fig is None
+    if owned:
+        fig = create_report_figure(
+            prices,
+            result,
+            fast_window=fast_window,
+            slow_window=slow_window,
+            ticker=ticker,
+        )
+    fig.savefig(output, dpi=dpi)
+    if owned:
         plt.close(fig)
-
     return output
 
 
-__all__ = ["create_report_figure", "render_report"]
+__all__ = ["ReportRenderer", "create_report_figure", "render_report"]
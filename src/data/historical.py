@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import datetime as dt
-import io
+import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 import requests
@@ -29,7 +29,20 @@ class HistoricalPriceLoader:
 
     def _cache_path(self, ticker: str) -> Path:
         safe_ticker = ticker.lower().replace("/", "-")
-        return self.cache_dir / f"{safe_ticker}.csv"
+        return self.cache_dir / f"{safe_ticker}.parquet"
+
+    def _migrate_csv_cache(self, cache_path: Path) -> None:
+        """Convert a cache file written by older versions (CSV) to Parquet."""
+        legacy_path = cache_path.with_suffix(".csv")
+        if cache_path.exists() or not legacy_path.exists():
+            return
+        df = pd.read_csv(legacy_path, parse_dates=["date"])
+        df["date"] = df["date"].astype("datetime64[ns]")
+        df.sort_values("date").reset_index(drop=True).to_parquet(cache_path, index=False)
+        # Keep the original timestamp so freshness is still judged by download time.
+        stat = legacy_path.stat()
+        os.utime(cache_path, (stat.st_atime, stat.st_mtime))
+        legacy_path.unlink()
 
     def _is_cache_fresh(self, cache_path: Path, max_age: dt.timedelta) -> bool:
         if not cache_path.exists():
@@ -45,31 +58,84 @@ class HistoricalPriceLoader:
         """
 
         cache_path = self._cache_path(ticker)
+        self._migrate_csv_cache(cache_path)
         if self._is_cache_fresh(cache_path, max_age):
             return self._read_cached(cache_path)
 
-        df = self._download_daily_bars(ticker)
+        validators = self._read_validators(cache_path) if cache_path.exists() else {}
+        df, validators = self._download_daily_bars(ticker, validators)
+        if df is None:
+            # 304 Not Modified: the cached copy is current, restart its freshness window.
+            cache_path.touch()
+            return self._read_cached(cache_path)
         if not df.empty:
-            df.to_csv(cache_path, index=False)
+            df.to_parquet(cache_path, index=False)
+            self._write_validators(cache_path, validators)
         return df
 
+    def _validators_path(self, cache_path: Path) -> Path:
+        return cache_path.with_suffix(".meta.json")
+
+    def _read_validators(self, cache_path: Path) -> Dict[str, str]:
+        """Return the ETag/Last-Modified headers recorded for ``cache_path``."""
+        try:
+            return json.loads(self._validators_path(cache_path).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_validators(self, cache_path: Path, validators: Dict[str, str]) -> None:
+        meta_path = self._validators_path(cache_path)
+        if validators:
+            meta_path.write_text(json.dumps(validators))
+        else:
+            meta_path.unlink(missing_ok=True)
+
     def _read_cached(self, path: Path) -> pd.DataFrame:
-        df = pd.read_csv(path, parse_dates=["date"])
-        return df.sort_values("date").reset_index(drop=True)
+        # Frames are sorted before they are written, so no re-sort is needed here.
+        return pd.read_parquet(path)
+
+    def _download_daily_bars(
+        self, ticker: str, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[pd.DataFrame], Dict[str, str]]:
+        """Download daily bars, returning ``(frame, validators)``.
 
-    def _download_daily_bars(self, ticker: str) -> pd.DataFrame:
+        ``validators`` from a previous download are sent as conditional request
+        headers; if the server answers 304 Not Modified the frame is ``None``.
+        """
         url_ticker = ticker.lower()
         if not url_ticker.endswith(".us") and not url_ticker.endswith(".uk"):
             # Assume US exchange by default
             url_ticker = f"{url_ticker}.us"
 
         url = f"https://stooq.com/q/d/l/?s={url_ticker}&i=d"
-        response = self.session.get(url, timeout=30)
-        response.raise_for_status()
-        if "No data" in response.text:
+        # Set per request so a caller-supplied session keeps its own headers.
+        headers = {"Accept-Encoding": "gzip, deflate"}
+        if validators:
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last_modified" in validators:
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        with self.session.get(url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 304:
+                return None, validators
+            response.raise_for_status()
+            new_validators = {
+                key: response.headers[header]
+                for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+                if header in response.headers
+            }
+            # Parse straight off the (decompressed) socket rather than buffering the body.
+            response.raw.decode_content = True
+            try:
+                df = pd.read_csv(response.raw, engine="pyarrow")
+            except ValueError:
+                # Stooq answers unknown tickers with a bare "No data" body.
+                df = pd.DataFrame()
+        if "Date" not in df.columns:
             raise ValueError(f"No data available for ticker '{ticker}'")
-        csv_bytes = response.content
-        df = pd.read_csv(io.BytesIO(csv_bytes), parse_dates=["Date"])
+        # Pin the unit: Parquet cannot store seconds and would read back as ms.
+        df["Date"] = pd.to_datetime(df["Date"]).astype("datetime64[ns]")
         df.rename(
             columns={
                 "Date": "date",
@@ -81,7 +147,7 @@ class HistoricalPriceLoader:
             },
             inplace=True,
         )
-        return df.sort_values("date").reset_index(drop=True)
+        return df.sort_values("date").reset_index(drop=True), new_validators
 
 
 __all__ = ["HistoricalPriceLoader"]
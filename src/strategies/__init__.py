@@ -1,4 +1,4 @@
 """Trading strategies."""
-from .moving_average import MovingAverageCrossover
+from .moving_average import MovingAverageCrossover, StreamingMACross
 
-__all__ = ["MovingAverageCrossover"]
+__all__ = ["MovingAverageCrossover", "StreamingMACross"]
@@ -1,10 +1,87 @@
 """Technical analysis strategies."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba wheels lag new Python releases
+    njit = None
+
+
+def _ema_step_loop(ema: float, weight: float, x: float, alpha: float) -> tuple[float, float]:
+    """Advance one ``ewm(adjust=False)`` EMA by the close ``x``.
+
+    ``weight`` is the decayed weight of the held ``ema``; it is 1 after every
+    valid close and shrinks by ``1 - alpha`` per NaN close, so the next valid
+    close is weighted against the held value as pandas does. Returns the new
+    ``(ema, weight)``.
+    """
+    if ema != ema:  # no valid close seen yet
+        return x, 1.0
+    weight *= 1.0 - alpha
+    if x != x:
+        return ema, weight
+    return (weight * ema + alpha * x) / (weight + alpha), 1.0
+
+
+# Shared with the engine's grid kernel, which must follow the same recurrence.
+_ema_step = njit(cache=True)(_ema_step_loop) if njit is not None else _ema_step_loop
+
+
+def _ema_crossover_loop(
+    close: np.ndarray, a_fast: float, a_slow: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Single pass over ``close`` returning ``(signal, fast_ema, slow_ema)``.
+
+    The signal is 1 where the fast EMA is above the slow EMA and 0 otherwise.
+    NaN closes are handled like ``ewm(adjust=False)`` (see ``_ema_step_loop``).
+    """
+    n = close.shape[0]
+    signal = np.zeros(n, dtype=np.int8)
+    fast_ema = np.empty(n, dtype=np.float64)
+    slow_ema = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return signal, fast_ema, slow_ema
+    ef = close[0]
+    es = close[0]
+    wf = 1.0
+    ws = 1.0
+    fast_ema[0] = ef
+    slow_ema[0] = es
+    for i in range(1, n):
+        ef, wf = _ema_step(ef, wf, close[i], a_fast)
+        es, ws = _ema_step(es, ws, close[i], a_slow)
+        fast_ema[i] = ef
+        slow_ema[i] = es
+        signal[i] = ef > es
+    return signal, fast_ema, slow_ema
+
+
+def _ema_crossover_pandas(
+    close: np.ndarray, a_fast: float, a_slow: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fallback for ``_ema_crossover_loop`` built on pandas' compiled ``ewm``."""
+    series = pd.Series(close)
+    fast_ema = series.ewm(alpha=a_fast, adjust=False).mean().to_numpy()
+    slow_ema = series.ewm(alpha=a_slow, adjust=False).mean().to_numpy()
+    signal = np.empty(len(close), dtype=np.int8)
+    # Compare straight into the int8 buffer; no bool temporary, no int64 copy.
+    np.greater(fast_ema, slow_ema, out=signal.view(np.bool_))
+    return signal, fast_ema, slow_ema
+
+
+if njit is not None:
+    # No fastmath: it would make the NaN checks above undefined.
+    _ema_crossover = njit(cache=True)(_ema_crossover_loop)
+    # Compile at import so the first backtest does not pay the JIT latency.
+    _ema_crossover(np.zeros(2, dtype=np.float64), 0.5, 0.5)
+else:
+    _ema_crossover = _ema_crossover_pandas
+
 
 @dataclass
 class MovingAverageCrossover:
@@ -15,13 +92,66 @@ class MovingAverageCrossover:
 
     def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
         """Return target position (1 long / 0 flat) per bar."""
+        return self.compute(prices)[0]
+
+    def compute(self, prices: pd.DataFrame) -> tuple[pd.Series, np.ndarray, np.ndarray]:
+        """Return ``(signals, fast_ema, slow_ema)`` from a single pass.
+
+        The engine calls this when available so the EMAs reach the report
+        without being recomputed.
+        """
         if "close" not in prices.columns:
             raise ValueError("prices DataFrame must include a 'close' column")
         close = prices["close"]
-        fast_ema = close.ewm(span=self.fast_window, adjust=False).mean()
-        slow_ema = close.ewm(span=self.slow_window, adjust=False).mean()
-        signal = (fast_ema > slow_ema).astype(int)
-        return signal
+        a_fast = 2.0 / (self.fast_window + 1)
+        a_slow = 2.0 / (self.slow_window + 1)
+        signal, fast_ema, slow_ema = _ema_crossover(
+            close.to_numpy(dtype=np.float64), a_fast, a_slow
+        )
+        return pd.Series(signal, index=close.index), fast_ema, slow_ema
+
+
+@dataclass
+class StreamingMACross:
+    """Incremental EMA crossover for live prices, O(1) work per tick.
+
+    Feeding a price history through :meth:`update` one bar at a time yields the
+    same positions as :meth:`MovingAverageCrossover.generate_signals`.
+    """
+
+    fast_window: int = 12
+    slow_window: int = 26
+    fast_ema: float | None = field(default=None, init=False)
+    slow_ema: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._a_fast = 2.0 / (self.fast_window + 1)
+        self._a_slow = 2.0 / (self.slow_window + 1)
+        # Weight of the held EMAs, decayed once per tick since the last valid price.
+        self._w_fast = 1.0
+        self._w_slow = 1.0
+
+    def update(self, price: float) -> int:
+        """Fold in the next close and return the target position (1 long / 0 flat).
+
+        A NaN price leaves the EMAs unchanged, matching ``ewm(adjust=False)``.
+        """
+        if self.fast_ema is None or self.slow_ema is None:
+            if price == price:
+                self.fast_ema = self.slow_ema = float(price)
+            return 0
+        self._w_fast *= 1.0 - self._a_fast
+        self._w_slow *= 1.0 - self._a_slow
+        if price == price:
+            self.fast_ema = (self._w_fast * self.fast_ema + self._a_fast * price) / (
+                self._w_fast + self._a_fast
+            )
+            self.slow_ema = (self._w_slow * self.slow_ema + self._a_slow * price) / (
+                self._w_slow + self._a_slow
+            )
+            self._w_fast = 1.0
+            self._w_slow = 1.0
+        return int(self.fast_ema > self.slow_ema)
 
 
-__all__ = ["MovingAverageCrossover"]
+__all__ = ["MovingAverageCrossover", "StreamingMACross"]
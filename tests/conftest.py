@@ -0,0 +1,126 @@
+"""Shared fixtures for the test suite.
+
+Fixtures are session-scoped so the price frame and the reference backtest are
+built once; tests must treat them as read-only.
+"""
+import sys
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import pytest
+
+try:
+    import matplotlib
+except ModuleNotFoundError:  # pragma: no cover - optional dependency for tests
+    matplotlib = None
+else:
+    # Pin the headless backend before anything imports pyplot; pyplot itself
+    # is only imported by the report tests.
+    matplotlib.use("Agg", force=True)
+
+from backtest.engine import BacktestEngine
+
+
+_START = np.datetime64("2021-01-01", "D")
+
+
+@lru_cache(maxsize=None)
+def _dates(n: int) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(np.arange(_START, _START + n, dtype="datetime64[D]"))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _mpl_fast():
+    if matplotlib is None:
+        yield
+        return
+    matplotlib.rcParams.update(
+        {
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10_000,
+            "savefig.dpi": 72,
+            "savefig.bbox": "standard",
+        }
+    )
+    yield
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close("all")
+
+
+@lru_cache(maxsize=None)
+def _closed_signals(n: int) -> np.ndarray:
+    signals = np.zeros(n, dtype=np.float64)
+    signals[5:20] = 1.0
+    signals.setflags(write=False)
+    return signals
+
+
+@lru_cache(maxsize=None)
+def _open_signals(n: int) -> np.ndarray:
+    signals = np.zeros(n, dtype=np.float64)
+    signals[5:] = 1.0
+    signals.setflags(write=False)
+    return signals
+
+
+@pytest.fixture(
+    scope="session", params=[40, pytest.param(4000, marks=pytest.mark.slow)]
+)
+def n_rows(request) -> int:
+    """Fixture length; the long series is there to catch O(n^2) regressions."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def sample_prices(n_rows: int) -> pd.DataFrame:
+    steps = np.arange(n_rows, dtype=np.int64)
+    ohlc = np.empty((n_rows, 4), dtype=np.float64)
+    close = ohlc[:, 3]
+    close[:] = 100.0 + steps * 0.3 + np.sin(steps / 3.0) * 2.0
+    ohlc[:, 0] = close - 0.2
+    ohlc[:, 1] = close + 0.5
+    ohlc[:, 2] = close - 0.5
+    prices = pd.DataFrame(
+        ohlc,
+        index=pd.RangeIndex(n_rows),
+        columns=["open", "high", "low", "close"],
+        copy=False,
+    )
+    prices.insert(0, "date", _dates(n_rows))
+    prices["volume"] = 1_000_000 + steps * 1_000
+    return prices
+
+
+@pytest.fixture(scope="session")
+def closed_strategy():
+    class ClosedStrategy:
+        def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
+            return pd.Series(
+                _closed_signals(len(prices)), index=prices.index, copy=False
+            )
+
+    return ClosedStrategy()
+
+
+@pytest.fixture(scope="session")
+def open_strategy():
+    class OpenStrategy:
+        def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
+            return pd.Series(
+                _open_signals(len(prices)), index=prices.index, copy=False
+            )
+
+    return OpenStrategy()
+
+
+@pytest.fixture(scope="session")
+def engine() -> BacktestEngine:
+    return BacktestEngine(initial_capital=10_000.0)
+
+
+@pytest.fixture(scope="session")
+def closed_result(engine: BacktestEngine, sample_prices: pd.DataFrame, closed_strategy):
+    return engine.run(sample_prices, closed_strategy)
@@ -1,65 +1,20 @@
 import math
-import pytest
-
-try:
-    import pandas as pd
-except ModuleNotFoundError:  # pragma: no cover - optional dependency for tests
-    pytest.skip("pandas is required for backtest tests", allow_module_level=True)
-
-from backtest.engine import BacktestEngine
-
-
-@pytest.fixture
-def sample_prices() -> pd.DataFrame:
-    dates = pd.date_range("2021-01-01", periods=40, freq="D")
-    steps = pd.Series(range(len(dates)), dtype=float)
-    close = 100 + steps * 0.3 + steps.apply(lambda x: math.sin(x / 3.0) * 2)
-    open_ = close - 0.2
-    high = close + 0.5
-    low = close - 0.5
-    volume = (1_000_000 + steps * 1_000).astype(int)
-    return pd.DataFrame(
-        {
-            "date": dates,
-            "open": open_,
-            "high": high,
-            "low": low,
-            "close": close,
-            "volume": volume,
-        }
-    )
-
-
-@pytest.fixture
-def closed_strategy():
-    class ClosedStrategy:
-        def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
-            signals = pd.Series(0.0, index=prices.index)
-            signals.iloc[5:20] = 1.0
-            signals.iloc[20:] = 0.0
-            return signals
-
-    return ClosedStrategy()
 
+import numpy as np
+import pandas as pd
+import pytest
 
-@pytest.fixture
-def open_strategy():
-    class OpenStrategy:
-        def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
-            signals = pd.Series(0.0, index=prices.index)
-            signals.iloc[5:] = 1.0
-            return signals
-
-    return OpenStrategy()
+from backtest.engine import BacktestEngine, _run_kernel, _run_kernel_numpy
+from strategies.moving_average import MovingAverageCrossover
 
 
-def test_backtest_result_includes_trade_metrics(sample_prices, closed_strategy):
-    engine = BacktestEngine(initial_capital=10_000.0)
+def test_backtest_result_includes_trade_metrics(engine, sample_prices, closed_strategy):
     result = engine.run(sample_prices, closed_strategy)
 
     assert not result.trades.empty
+    trades = result.trades.to_dataframe()
     assert {"entry_price", "exit_price", "return_pct", "holding_period", "status"}.issubset(
-        result.trades.columns
+        trades.columns
     )
     assert len(result.daily_returns) == len(sample_prices)
     assert result.volatility >= 0
@@ -67,17 +22,118 @@ def test_backtest_result_includes_trade_metrics(sample_prices, closed_strategy):
 
     entry_date_expected = sample_prices.loc[6, "date"]
     exit_date_expected = sample_prices.loc[21, "date"]
-    assert result.trades.iloc[0]["entry_date"] == entry_date_expected
-    assert result.trades.iloc[0]["exit_date"] == exit_date_expected
-    assert result.trades.iloc[0]["holding_period"] > 0
+    assert trades.iloc[0]["entry_date"] == entry_date_expected
+    assert trades.iloc[0]["exit_date"] == exit_date_expected
+    assert trades.iloc[0]["holding_period"] > 0
 
 
-def test_backtest_marks_open_trades(sample_prices, open_strategy):
-    engine = BacktestEngine(initial_capital=10_000.0)
+def test_backtest_marks_open_trades(engine, sample_prices, open_strategy):
     result = engine.run(sample_prices, open_strategy)
 
     assert not result.trades.empty
-    last_trade = result.trades.iloc[-1]
+    last_trade = result.trades.to_dataframe().iloc[-1]
     assert last_trade["status"] == "OPEN"
     assert last_trade["exit_date"] == sample_prices.iloc[-1]["date"]
-    assert pd.notna(last_trade["return_pct"])
+    assert not math.isnan(last_trade["return_pct"])
+
+
+def test_nan_signals_are_treated_as_flat(engine, sample_prices, closed_strategy):
+    class GappyStrategy:
+        def generate_signals(self, prices):
+            signals = closed_strategy.generate_signals(prices).copy()
+            signals.iloc[10] = np.nan
+            return signals
+
+    result = engine.run(sample_prices, GappyStrategy())
+
+    assert np.isfinite(result.equity_curve).all()
+    assert math.isfinite(result.total_return)
+    assert math.isfinite(result.volatility)
+    assert result.trades.entry_idx.tolist() == [6, 12]
+    assert result.trades.exit_idx.tolist() == [11, 21]
+
+
+def test_tz_aware_dates_produce_datetime64_trades(
+    engine, sample_prices, closed_strategy, closed_result
+):
+    prices = sample_prices.assign(date=sample_prices["date"].dt.tz_localize("America/New_York"))
+
+    trades = engine.run(prices, closed_strategy).trades
+
+    assert np.issubdtype(trades.entry_date.dtype, np.datetime64)
+    np.testing.assert_array_equal(trades.entry_date, closed_result.trades.entry_date)
+    np.testing.assert_array_equal(trades.holding_period, closed_result.trades.holding_period)
+
+
+def test_final_equity_keeps_float64_precision(sample_prices, closed_strategy):
+    engine = BacktestEngine(initial_capital=123_456_789.0)
+    result = engine.run(sample_prices, closed_strategy)
+
+    assert result.final_equity == pytest.approx(
+        123_456_789.0 * (1 + result.total_return), rel=1e-12
+    )
+
+
+def test_fractional_position_changes_are_logged_as_trades(engine, sample_prices):
+    class ScaledStrategy:
+        def generate_signals(self, prices):
+            signals = np.zeros(len(prices))
+            signals[5:20] = 0.5
+            signals[20:] = 1.0
+            return pd.Series(signals, index=prices.index)
+
+    result = engine.run(sample_prices, ScaledStrategy())
+
+    assert result.trades.entry_idx.tolist() == [6, 21]
+    assert (result.trades.status == result.trades.OPEN).all()
+
+
+@pytest.mark.parametrize("nan_bar", [None, 10])
+def test_run_grid_matches_individual_runs(engine, sample_prices, nan_bar):
+    prices = sample_prices
+    if nan_bar is not None:
+        prices = sample_prices.copy()
+        prices.loc[nan_bar, "close"] = np.nan
+    grid = engine.run_grid(prices, fast_windows=[3, 5], slow_windows=[5, 12])
+
+    assert list(zip(grid["fast_window"], grid["slow_window"])) == [(3, 5), (3, 12), (5, 12)]
+    for row in grid.itertuples():
+        strategy = MovingAverageCrossover(fast_window=row.fast_window, slow_window=row.slow_window)
+        result = engine.run(prices, strategy)
+        assert row.total_return == pytest.approx(result.total_return, rel=1e-5)
+        assert row.max_drawdown == pytest.approx(result.max_drawdown, rel=1e-5)
+        assert row.sharpe_ratio == pytest.approx(result.sharpe_ratio, rel=1e-4)
+
+
+def test_numpy_kernel_fallback_matches_compiled_kernel(sample_prices):
+    close = sample_prices["close"].to_numpy(dtype=np.float32)
+    signals = (np.arange(len(close)) % 7 < 4).astype(np.float32)
+    outputs = []
+    for kernel in (_run_kernel, _run_kernel_numpy):
+        equity = np.empty(len(close), dtype=np.float32)
+        returns = np.empty(len(close), dtype=np.float32)
+        stats = kernel(close, signals, 10_000.0, equity, returns)
+        outputs.append((stats, equity, returns))
+
+    (stats, equity, returns), (np_stats, np_equity, np_returns) = outputs
+    assert np_stats == pytest.approx(stats, rel=1e-9)
+    np.testing.assert_allclose(np_equity, equity, rtol=1e-6)
+    np.testing.assert_allclose(np_returns, returns, rtol=1e-6)
+
+
+def test_compiled_kernel_accepts_strided_inputs(sample_prices):
+    kernels = pytest.importorskip("backtest._kernels")
+    # Columns of a 2D block, as handed out by a frame built without copying.
+    block = np.empty((len(sample_prices), 2), dtype=np.float32)
+    block[:, 0] = sample_prices["close"]
+    block[:, 1] = np.arange(len(block)) % 7 < 4
+    close, signals = block[:, 0], block[:, 1]
+    outputs = []
+    for kernel in (kernels.run_kernel, _run_kernel_numpy):
+        equity = np.empty(len(close), dtype=np.float32)
+        returns = np.empty(len(close), dtype=np.float32)
+        outputs.append((kernel(close, signals, 10_000.0, equity, returns), equity))
+
+    (stats, equity), (np_stats, np_equity) = outputs
+    assert np_stats == pytest.approx(stats, rel=1e-9)
+    np.testing.assert_allclose(np_equity, equity, rtol=1e-6)
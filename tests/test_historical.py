@@ -0,0 +1,121 @@
+import datetime as dt
+import io
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from data.historical import HistoricalPriceLoader
+
+CSV_BODY = (
+    b"Date,Open,High,Low,Close,Volume\n"
+    b"2021-01-05,101.0,102.0,100.0,101.5,1100\n"
+    b"2021-01-04,100.0,101.0,99.0,100.5,1000\n"
+)
+
+
+class StubResponse:
+    def __init__(self, status_code=200, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class StubSession:
+    """Stands in for ``requests.Session``, replaying queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+def _age(path, hours):
+    stamp = (dt.datetime.now() - dt.timedelta(hours=hours)).timestamp()
+    os.utime(path, (stamp, stamp))
+
+
+def test_download_caches_parquet_and_validators(tmp_path):
+    session = StubSession(
+        StubResponse(body=CSV_BODY, headers={"ETag": '"v1"', "Last-Modified": "Tue, 05 Jan 2021"})
+    )
+    loader = HistoricalPriceLoader(cache_dir=tmp_path, session=session)
+
+    df = loader.load_daily("TEST")
+
+    assert list(df.columns) == ["date", "open", "high", "low", "close", "volume"]
+    assert df["date"].is_monotonic_increasing
+    assert session.requests[0] == {"Accept-Encoding": "gzip, deflate"}
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "test.parquet"), df)
+    meta = json.loads((tmp_path / "test.meta.json").read_text())
+    assert meta == {"etag": '"v1"', "last_modified": "Tue, 05 Jan 2021"}
+
+
+def test_not_modified_reuses_and_refreshes_cache(tmp_path):
+    session = StubSession(
+        StubResponse(body=CSV_BODY, headers={"ETag": '"v1"'}),
+        StubResponse(status_code=304),
+    )
+    loader = HistoricalPriceLoader(cache_dir=tmp_path, session=session)
+    first = loader.load_daily("TEST")
+    cache_path = tmp_path / "test.parquet"
+    _age(cache_path, hours=24)
+
+    second = loader.load_daily("TEST")
+
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    pd.testing.assert_frame_equal(second, first)
+    assert loader._is_cache_fresh(cache_path, dt.timedelta(hours=12))
+
+
+def test_download_without_validators_drops_stale_sidecar(tmp_path):
+    session = StubSession(
+        StubResponse(body=CSV_BODY, headers={"ETag": '"v1"'}),
+        StubResponse(body=CSV_BODY),
+    )
+    loader = HistoricalPriceLoader(cache_dir=tmp_path, session=session)
+    loader.load_daily("TEST")
+    _age(tmp_path / "test.parquet", hours=24)
+
+    loader.load_daily("TEST")
+
+    assert not (tmp_path / "test.meta.json").exists()
+
+
+def test_no_data_response_raises(tmp_path):
+    loader = HistoricalPriceLoader(cache_dir=tmp_path, session=StubSession(StubResponse(body=b"No data")))
+
+    with pytest.raises(ValueError, match="No data available"):
+        loader.load_daily("UNKNOWN")
+    assert not (tmp_path / "unknown.parquet").exists()
+
+
+def test_legacy_csv_cache_is_migrated_to_parquet(tmp_path):
+    legacy_path = tmp_path / "test.csv"
+    legacy_path.write_text(
+        "date,open,high,low,close,volume\n"
+        "2021-01-05,101.0,102.0,100.0,101.5,1100\n"
+        "2021-01-04,100.0,101.0,99.0,100.5,1000\n"
+    )
+    loader = HistoricalPriceLoader(cache_dir=tmp_path, session=StubSession())
+
+    df = loader.load_daily("TEST")
+
+    assert not legacy_path.exists()
+    assert (tmp_path / "test.parquet").exists()
+    assert df["date"].dtype == "datetime64[ns]"
+    assert df["date"].tolist() == [pd.Timestamp("2021-01-04"), pd.Timestamp("2021-01-05")]
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from strategies.moving_average import (
+    MovingAverageCrossover,
+    StreamingMACross,
+    _ema_crossover,
+    _ema_crossover_pandas,
+)
+
+
+def test_ema_crossover_matches_pandas_fallback_across_nan_closes():
+    close = 100 + np.cumsum(np.sin(np.arange(60) / 4.0))
+    close[0] = np.nan
+    close[10] = np.nan
+    close[30:33] = np.nan
+    a_fast, a_slow = 2.0 / 6, 2.0 / 13
+
+    signal, fast_ema, slow_ema = _ema_crossover(close, a_fast, a_slow)
+    pd_signal, pd_fast, pd_slow = _ema_crossover_pandas(close, a_fast, a_slow)
+
+    np.testing.assert_array_equal(signal, pd_signal)
+    np.testing.assert_allclose(fast_ema, pd_fast, rtol=1e-12)
+    np.testing.assert_allclose(slow_ema, pd_slow, rtol=1e-12)
+
+
+def test_streaming_cross_matches_batch_signals(sample_prices):
+    batch, fast_ema, slow_ema = MovingAverageCrossover(fast_window=5, slow_window=12).compute(
+        sample_prices
+    )
+    stream = StreamingMACross(fast_window=5, slow_window=12)
+
+    positions = [stream.update(price) for price in sample_prices["close"]]
+
+    assert positions == batch.tolist()
+    assert stream.fast_ema == fast_ema[-1]
+    assert stream.slow_ema == slow_ema[-1]
+
+
+def test_generate_signals_concatenate_like_plain_series(sample_prices):
+    a = MovingAverageCrossover(fast_window=3, slow_window=8).generate_signals(sample_prices)
+    b = MovingAverageCrossover(fast_window=5, slow_window=12).generate_signals(sample_prices)
+
+    assert not a.attrs
+    assert len(pd.concat([a, b])) == 2 * len(sample_prices)
+    assert pd.concat([a, b], axis=1).shape == (len(sample_prices), 2)
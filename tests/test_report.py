@@ -1,60 +1,22 @@
-import math
-import pytest
-
-try:
-    import matplotlib.pyplot as plt
-except ModuleNotFoundError:  # pragma: no cover - optional dependency for tests
-    pytest.skip("matplotlib is required for report tests", allow_module_level=True)
-
-try:
-    import pandas as pd
-except ModuleNotFoundError:  # pragma: no cover - optional dependency for tests
-    pytest.skip("pandas is required for report tests", allow_module_level=True)
-
-from backtest.engine import BacktestEngine
-from backtest.report import create_report_figure, render_report
-
-
-@pytest.fixture
-def sample_prices() -> pd.DataFrame:
-    dates = pd.date_range("2021-01-01", periods=40, freq="D")
-    steps = pd.Series(range(len(dates)), dtype=float)
-    close = 100 + steps * 0.3 + steps.apply(lambda x: math.sin(x / 3.0) * 2)
-    open_ = close - 0.2
-    high = close + 0.5
-    low = close - 0.5
-    volume = (1_000_000 + steps * 1_000).astype(int)
-    return pd.DataFrame(
-        {
-            "date": dates,
-            "open": open_,
-            "high": high,
-            "low": low,
-            "close": close,
-            "volume": volume,
-        }
-    )
+import os
 
+import numpy as np
+import pandas as pd
+import pytest
 
-@pytest.fixture
-def closed_strategy():
-    class ClosedStrategy:
-        def generate_signals(self, prices: pd.DataFrame) -> pd.Series:
-            signals = pd.Series(0.0, index=prices.index)
-            signals.iloc[5:20] = 1.0
-            signals.iloc[20:] = 0.0
-            return signals
+pytestmark = pytest.mark.report
 
-    return ClosedStrategy()
 
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("reports")
 
-@pytest.fixture
-def closed_result(sample_prices: pd.DataFrame, closed_strategy):
-    engine = BacktestEngine(initial_capital=10_000.0)
-    return engine.run(sample_prices, closed_strategy)
 
+@pytest.fixture(scope="module")
+def report_figure(sample_prices, closed_result):
+    plt = pytest.importorskip("matplotlib.pyplot")
+    from backtest.report import create_report_figure
 
-def test_create_report_figure_has_three_axes(sample_prices, closed_result):
     fig = create_report_figure(
         sample_prices,
         closed_result,
@@ -62,14 +24,19 @@ def test_create_report_figure_has_three_axes(sample_prices, closed_result):
         slow_window=12,
         ticker="TEST",
     )
-    try:
-        assert len(fig.axes) == 3
-    finally:
-        plt.close(fig)
+    yield fig
+    plt.close(fig)
+
 
+def test_create_report_figure_has_three_axes(report_figure):
+    assert len(report_figure.axes) == 3
 
-def test_render_report_writes_file(tmp_path, sample_prices, closed_result):
-    output = tmp_path / "report.png"
+
+def test_render_report_writes_file(out_dir, sample_prices, closed_result, report_figure):
+    pytest.importorskip("matplotlib.pyplot")
+    from backtest.report import render_report
+
+    output = out_dir / "report.png"
     path = render_report(
         sample_prices,
         closed_result,
@@ -78,7 +45,49 @@ def test_render_report_writes_file(tmp_path, sample_prices, closed_result):
         output=output,
         ticker="TEST",
         show=False,
+        fig=report_figure,
+        dpi=None,
+    )
+    assert os.path.abspath(path) == os.path.abspath(output)
+    assert os.stat(path).st_size > 0
+
+
+def test_render_many_matches_render_report(out_dir, engine, sample_prices, closed_result):
+    plt = pytest.importorskip("matplotlib.pyplot")
+    from backtest.report import ReportRenderer, render_report
+
+    class FlatStrategy:
+        def generate_signals(self, prices):
+            return pd.Series(0.0, index=prices.index)
+
+    # The no-trades run in between forces the trade table to be rebuilt.
+    flat_result = engine.run(sample_prices, FlatStrategy())
+    runs = [(closed_result, 5, 12), (flat_result, 5, 12), (closed_result, 5, 12)]
+    outputs = [out_dir / f"many_{i}.png" for i in range(len(runs))]
+    with ReportRenderer() as renderer:
+        paths = renderer.render_many(sample_prices, runs, outputs, ticker="TEST", dpi=72)
+
+    for path, (result, fast_window, slow_window) in zip(paths, runs):
+        expected = render_report(
+            sample_prices,
+            result,
+            fast_window=fast_window,
+            slow_window=slow_window,
+            output=out_dir / "single.png",
+            ticker="TEST",
+            dpi=72,
+        )
+        np.testing.assert_array_equal(plt.imread(path), plt.imread(expected))
+
+
+def test_render_report_handles_tz_aware_dates(out_dir, engine, sample_prices, closed_strategy):
+    pytest.importorskip("matplotlib.pyplot")
+    from backtest.report import render_report
+
+    prices = sample_prices.assign(date=sample_prices["date"].dt.tz_localize("Europe/Vilnius"))
+    result = engine.run(prices, closed_strategy)
+
+    path = render_report(
+        prices, result, fast_window=5, slow_window=12, output=out_dir / "tz.png", dpi=None
     )
-    assert path == output.resolve()
-    assert path.exists()
-    assert path.is_file()
+    assert os.stat(path).st_size > 0